@@ -34,8 +34,8 @@ class Schema:
         """Convert external format to standard schema."""
         if source not in self.mappings:
             return df.copy()
-        result = df.copy()
-        return result.rename(columns=self.mappings[source])
+        # rename() already returns a new frame; no separate copy needed
+        return df.rename(columns=self.mappings[source])
 
     def to_external(self, df: pd.DataFrame, target: str) -> pd.DataFrame:
         """Convert standard schema to external format."""
@@ -43,7 +43,8 @@ class Schema:
             return df.copy()
         # Invert the mapping: {standard_name: external_name}
         inverse = {v: k for k, v in self.mappings[target].items()}
-        result = df.copy()
+        # drop() and rename() both return new frames, so df itself is never modified
+        result = df
 
         # Drop target columns that already exist to avoid duplicates after rename
         existing_targets = [col for col in inverse.values() if col in result.columns]
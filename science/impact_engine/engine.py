@@ -6,8 +6,8 @@ import pandas as pd
 from artifact_store import create_job
 
 from .config import parse_config_file
-from .metrics import create_metrics_manager
-from .models import create_models_manager
+from .metrics import create_metrics_manager_from_config
+from .models import create_models_manager_from_config
 
 
 def evaluate_impact(config_path: str, storage_url: str = "./data") -> str:
@@ -38,13 +38,14 @@ def evaluate_impact(config_path: str, storage_url: str = "./data") -> str:
     # Load products from CSV
     products = pd.read_csv(data_path)
 
-    # Initialize components using factory functions
+    # Initialize components from the already-parsed config sections
     # Factories handle adapter/model selection based on configuration
-    metrics_manager = create_metrics_manager(config_path, parent_job=job)
-    models_manager = create_models_manager(config_path)
+    models_manager = create_models_manager_from_config(config["MEASUREMENT"])
 
     # Retrieve business metrics using metrics layer
-    business_metrics = metrics_manager.retrieve_metrics(products)
+    # The metrics source is disconnected as soon as retrieval completes
+    with create_metrics_manager_from_config(config["DATA"], parent_job=job) as metrics_manager:
+        business_metrics = metrics_manager.retrieve_metrics(products)
 
     # Aggregate metrics by date for time series analysis
     # Sum numeric columns, keep date
@@ -7,8 +7,9 @@ Integration is governed by contracts (schemas) and config bridge (config transla
 import os
 import tempfile
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import yaml
 from artifact_store import JobInfo, create_job
@@ -16,10 +17,41 @@ from artifact_store import JobInfo, create_job
 from ..core import ConfigBridge, MetricsSchema, ProductSchema
 from .base import MetricsInterface
 
+# Resolved once at import time; None if the simulator package is not installed
+try:
+    from online_retail_simulator.core import RuleBackend
+except ImportError:
+    RuleBackend = None
+
+# Column names (besides anything containing "id") accepted as product identifiers
+_ID_COLUMN_NAMES = frozenset({"product", "sku", "code"})
+
+
+def _find_id_column(columns) -> Optional[str]:
+    """Return the first column that looks like a product identifier, or None."""
+    for col in columns:
+        lowered = col.lower()
+        if "id" in lowered or lowered in _ID_COLUMN_NAMES:
+            return col
+    return None
+
+
+def _ensure_numeric(values: pd.Series) -> pd.Series:
+    """Coerce a column to numeric, skipping the conversion if it already is."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values
+    return pd.to_numeric(values, errors="coerce")
+
 
 class CatalogSimulatorAdapter(MetricsInterface):
     """Adapter for catalog simulator that implements MetricsInterface."""
 
+    # Template returned (as a shallow copy) when the simulator yields no rows
+    _EMPTY_RESULT = pd.DataFrame(columns=MetricsSchema.all_columns())
+
+    # Output column order (required + optional), built once for every transform_inbound call
+    _COLUMN_ORDER = pd.Index(MetricsSchema.all_columns())
+
     def __init__(self):
         """Initialize the CatalogSimulatorAdapter."""
         self.is_connected = False
@@ -64,49 +96,65 @@ class CatalogSimulatorAdapter(MetricsInterface):
         self.is_connected = True
         return True
 
+    def disconnect(self) -> None:
+        """Disconnect from the catalog simulator and drop job references."""
+        self.is_connected = False
+        self.parent_job = None
+        self.simulation_job = None
+
     def retrieve_business_metrics(
         self, products: pd.DataFrame, start_date: str, end_date: str
     ) -> pd.DataFrame:
         """Retrieve business metrics using catalog simulator's job-aware API."""
-        if not self.is_connected:
-            raise ConnectionError("Not connected to simulator. Call connect() first.")
+        return self.retrieve_business_metrics_batch(products, [(start_date, end_date)])
 
-        if products is None or len(products) == 0:
-            raise ValueError("Products DataFrame cannot be empty")
-
-        try:
-            from online_retail_simulator.simulate import simulate_metrics
-
-            # 1. Create nested job for simulation artifacts
-            self._create_simulation_job()
+    def retrieve_business_metrics_batch(
+        self, products: pd.DataFrame, date_ranges: List[Tuple[str, str]]
+    ) -> pd.DataFrame:
+        """Retrieve business metrics for several date ranges in one call.
 
-            # 2. Transform input and save products to job (simulate_metrics expects them there)
-            transformed_input = self.transform_outbound(products, start_date, end_date)
-            self.simulation_job.save_df("products", transformed_input["product_characteristics"])
+        Products are transformed once; each range then only swaps the simulation
+        dates and runs in its own nested simulation job. Enrichment and the inbound
+        transformation are applied once to the combined sales.
 
-            # 3. Build full simulator config
-            simulator_config = {"RULE": transformed_input["rule_config"]}
+        Args:
+            products: DataFrame with product identifiers and characteristics
+            date_ranges: (start_date, end_date) pairs in YYYY-MM-DD format
 
-            # 4. Write config to temp file for simulate_metrics
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-                yaml.dump(simulator_config, f)
-                config_path = f.name
+        Returns:
+            DataFrame with business metrics for all date ranges
+        """
+        if not self.is_connected:
+            raise ConnectionError("Not connected to simulator. Call connect() first.")
 
-            try:
-                # 5. Call catalog_simulator's simulate_metrics (handles backend + storage)
-                simulate_metrics(self.simulation_job, config_path)
-            finally:
-                # Clean up temp file
-                os.unlink(config_path)
+        if products is None or len(products) == 0:
+            raise ValueError("Products DataFrame cannot be empty")
 
-            # 6. Load sales from job
-            sales_df = self.simulation_job.load_df("sales")
+        if not date_ranges:
+            raise ValueError("At least one date range is required")
 
-            # 7. Apply enrichment if configured
+        try:
+            # 1. Transform products once for all ranges
+            transformed_input = self.transform_outbound(
+                products, date_ranges[0][0], date_ranges[-1][1]
+            )
+            product_characteristics = transformed_input["product_characteristics"]
+            rule_config = transformed_input["rule_config"]
+            metrics_params = rule_config["METRICS"]["PARAMS"]
+
+            # 2. Simulate each range, only updating the dates in the config
+            sales_frames = []
+            for start_date, end_date in date_ranges:
+                metrics_params["date_start"] = start_date
+                metrics_params["date_end"] = end_date
+                sales_frames.append(self._simulate_sales(product_characteristics, rule_config))
+            sales_df = pd.concat(sales_frames, ignore_index=True)
+
+            # 3. Apply enrichment if configured
             if self.config.get("enrichment"):
                 sales_df = self._apply_enrichment(sales_df)
 
-            # 8. Transform to impact engine format
+            # 4. Transform to impact engine format
             return self.transform_inbound(sales_df)
 
         except ImportError as e:
@@ -114,6 +162,30 @@ class CatalogSimulatorAdapter(MetricsInterface):
         except Exception as e:
             raise RuntimeError(f"Failed to retrieve metrics: {e}")
 
+    def _simulate_sales(
+        self, product_characteristics: pd.DataFrame, rule_config: Dict[str, Any]
+    ) -> pd.DataFrame:
+        """Run simulate_metrics in a new simulation job and return the simulated sales."""
+        from online_retail_simulator.simulate import simulate_metrics
+
+        # Create nested job and save products to it (simulate_metrics expects them there)
+        self._create_simulation_job()
+        self.simulation_job.save_df("products", product_characteristics)
+
+        # Write config to temp file for simulate_metrics
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            yaml.dump({"RULE": rule_config}, f)
+            config_path = f.name
+
+        try:
+            # Call catalog_simulator's simulate_metrics (handles backend + storage)
+            simulate_metrics(self.simulation_job, config_path)
+        finally:
+            # Clean up temp file
+            os.unlink(config_path)
+
+        return self.simulation_job.load_df("sales")
+
     def _create_simulation_job(self) -> None:
         """Create a job for simulation artifacts. Uses nested job if parent provided."""
         if self.parent_job is not None:
@@ -159,39 +231,17 @@ class CatalogSimulatorAdapter(MetricsInterface):
 
     def validate_connection(self) -> bool:
         """Validate that the catalog simulator connection is active and functional."""
-        if not self.is_connected:
-            return False
-
-        try:
-            from online_retail_simulator.core import RuleBackend  # noqa: F401
-
-            return True
-        except ImportError:
-            return False
+        return self.is_connected and RuleBackend is not None
 
     def transform_outbound(
         self, products: pd.DataFrame, start_date: str, end_date: str
     ) -> Dict[str, Any]:
         """Transform impact engine format to catalog simulator format using contracts."""
-        product_characteristics = products.copy()
-
-        # Ensure product_id exists before transformation
-        if "product_id" not in product_characteristics.columns:
-            # Try to find a suitable ID column
-            id_columns = [
-                col
-                for col in product_characteristics.columns
-                if "id" in col.lower() or col.lower() in ["product", "sku", "code"]
-            ]
-            if id_columns:
-                product_characteristics["product_id"] = product_characteristics[id_columns[0]]
-            else:
-                product_characteristics["product_id"] = product_characteristics.index.astype(str)
-
-        # Use contract to transform product_id → asin
-        product_characteristics = ProductSchema.to_external(
-            product_characteristics, "catalog_simulator"
-        )
+        if "asin" in products.columns and "product_id" not in products.columns:
+            # Already in catalog simulator format, nothing to transform
+            product_characteristics = products
+        else:
+            product_characteristics = self._to_simulator_products(products)
 
         # Use config bridge to build simulator config
         ie_config = {
@@ -210,41 +260,69 @@ class CatalogSimulatorAdapter(MetricsInterface):
             "rule_config": cs_config["RULE"],
         }
 
+    def _to_simulator_products(self, products: pd.DataFrame) -> pd.DataFrame:
+        """Map impact engine products to catalog simulator products (product_id → asin)."""
+        product_characteristics = products
+
+        # Ensure product_id exists before transformation
+        if "product_id" not in product_characteristics.columns:
+            # Try to find a suitable ID column
+            id_column = _find_id_column(product_characteristics.columns)
+            if id_column is not None:
+                product_id = product_characteristics[id_column]
+            else:
+                product_id = product_characteristics.index.astype(str)
+            # assign() returns a new frame, leaving the caller's products untouched
+            product_characteristics = product_characteristics.assign(product_id=product_id)
+
+        # Use contract to transform product_id → asin (returns a new frame)
+        return ProductSchema.to_external(product_characteristics, "catalog_simulator")
+
     def transform_inbound(self, external_data: Any) -> pd.DataFrame:
         """Transform catalog simulator response to impact engine format using contracts."""
         if not isinstance(external_data, pd.DataFrame):
             raise ValueError("Expected pandas DataFrame from catalog simulator")
 
         if external_data.empty:
-            return pd.DataFrame(columns=MetricsSchema.all_columns())
+            return self._EMPTY_RESULT.copy(deep=False)
 
         # Use contract to transform asin → product_id, ordered_units → sales_volume
         standardized = MetricsSchema.from_external(external_data, "catalog_simulator")
 
+        # Snapshot column names once for the membership checks below
+        columns = frozenset(standardized.columns)
+
         # Handle legacy 'quantity' column (not in contract, manual fallback)
-        if "quantity" in standardized.columns and "sales_volume" not in standardized.columns:
-            standardized["sales_volume"] = standardized["quantity"]
-            standardized.drop("quantity", axis=1, inplace=True)
+        if "quantity" in columns and "sales_volume" not in columns:
+            standardized = standardized.rename(columns={"quantity": "sales_volume"})
+            columns = frozenset(standardized.columns)
 
-        # Ensure date column is datetime
-        if "date" in standardized.columns:
+        # Ensure date column is datetime (skip parsing if it already is)
+        if "date" in columns and not pd.api.types.is_datetime64_any_dtype(standardized["date"]):
             standardized["date"] = pd.to_datetime(standardized["date"])
 
         # Add metadata fields
-        standardized["metrics_source"] = "catalog_simulator"
+        # metrics_source is constant, so store it as a single-category categorical
+        standardized["metrics_source"] = pd.Categorical.from_codes(
+            np.zeros(len(standardized), dtype=np.int8), categories=["catalog_simulator"]
+        )
         standardized["retrieval_timestamp"] = datetime.now()
 
-        # Ensure proper data types
-        if "price" in standardized.columns:
-            standardized["price"] = pd.to_numeric(standardized["price"], errors="coerce")
-        if "revenue" in standardized.columns:
-            standardized["revenue"] = pd.to_numeric(standardized["revenue"], errors="coerce")
-        if "sales_volume" in standardized.columns:
-            standardized["sales_volume"] = (
-                pd.to_numeric(standardized["sales_volume"], errors="coerce").fillna(0).astype(int)
-            )
-
-        # Reorder columns to match schema (required + optional)
-        column_order = MetricsSchema.all_columns()
-        available_columns = [col for col in column_order if col in standardized.columns]
-        return standardized[available_columns]
+        # Ensure proper data types (columns already of the right dtype are left as is)
+        if "price" in columns:
+            standardized["price"] = _ensure_numeric(standardized["price"])
+        if "revenue" in columns:
+            standardized["revenue"] = _ensure_numeric(standardized["revenue"])
+        if "sales_volume" in columns:
+            sales_volume = standardized["sales_volume"]
+            if sales_volume.dtype != np.dtype(int):
+                standardized["sales_volume"] = _ensure_numeric(sales_volume).fillna(0).astype(int)
+
+        # Product categories are low-cardinality labels
+        if "category" in columns and not isinstance(
+            standardized["category"].dtype, pd.CategoricalDtype
+        ):
+            standardized["category"] = standardized["category"].astype("category")
+
+        # Reorder columns to match schema (required + optional), keeping only those present
+        return standardized[self._COLUMN_ORDER.intersection(standardized.columns, sort=False)]
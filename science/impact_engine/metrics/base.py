@@ -16,6 +16,14 @@ class MetricsInterface(ABC):
         """Establish connection to the metrics source."""
         pass
 
+    def disconnect(self) -> None:
+        """Release any resources held by the metrics source.
+
+        Optional hook for implementations that hold connections or handles;
+        the default implementation does nothing.
+        """
+        pass
+
     @abstractmethod
     def retrieve_business_metrics(
         self, products: pd.DataFrame, start_date: str, end_date: str
@@ -87,11 +87,12 @@ def get_metrics_adapter(metrics_type: str) -> MetricsInterface:
     Raises:
         ValueError: If the metrics type is not supported.
     """
-    if metrics_type not in METRICS_ADAPTERS:
-        available = list(METRICS_ADAPTERS.keys())
+    adapter_class = METRICS_ADAPTERS.get(metrics_type)
+    if adapter_class is None:
+        available = sorted(METRICS_ADAPTERS)
         raise ValueError(f"Unknown metrics type '{metrics_type}'. Available types: {available}")
 
-    return METRICS_ADAPTERS[metrics_type]()
+    return adapter_class()
 
 
 def register_metrics_adapter(metrics_type: str, adapter_class: type) -> None:
@@ -2,8 +2,10 @@
 Metrics Manager for coordinating metrics operations.
 """
 
+import operator
 from datetime import datetime
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 import pandas as pd
 from artifact_store import JobInfo
@@ -31,19 +33,20 @@ class MetricsManager:
             metrics_source: The metrics implementation to use for data retrieval.
             parent_job: Optional parent job for artifact management.
         """
-        self.data_config = data_config
+        # Read-only view of a private copy, so the values resolved below cannot go stale
+        self.data_config: Mapping[str, Any] = MappingProxyType(dict(data_config))
         self.metrics_source = metrics_source
         self.parent_job = parent_job
 
         # Validate the data config
-        self._validate_data_config(data_config)
+        self._validate_data_config(self.data_config)
 
         # Connect the injected metrics source
         connection_config = self._build_connection_config()
         if not self.metrics_source.connect(connection_config):
             raise ConnectionError("Failed to connect to metrics source")
 
-    def _validate_data_config(self, data_config: Dict[str, Any]) -> None:
+    def _validate_data_config(self, data_config: Mapping[str, Any]) -> None:
         """Validate DATA configuration block."""
         required_fields = ["START_DATE", "END_DATE"]
         for field in required_fields:
@@ -61,6 +64,21 @@ class MetricsManager:
         if start_date > end_date:
             raise ValueError("START_DATE must be before or equal to END_DATE in DATA configuration")
 
+        # Keep the date range, raw and parsed, so it is resolved only once
+        self._date_range = (data_config["START_DATE"], data_config["END_DATE"])
+        self._start_date = start_date
+        self._end_date = end_date
+
+    @property
+    def start_date(self) -> datetime:
+        """Start of the configured date range as a datetime."""
+        return self._start_date
+
+    @property
+    def end_date(self) -> datetime:
+        """End of the configured date range as a datetime."""
+        return self._end_date
+
     def _build_connection_config(self) -> Dict[str, Any]:
         """Build connection configuration from DATA config."""
         config = {
@@ -75,19 +93,90 @@ class MetricsManager:
 
         return config
 
-    def retrieve_metrics(self, products: pd.DataFrame) -> pd.DataFrame:
-        """Retrieve business metrics for specified products using DATA configuration date range."""
+    def retrieve_metrics(
+        self, products: pd.DataFrame, batch_size: Optional[int] = None
+    ) -> pd.DataFrame:
+        """Retrieve business metrics for specified products using DATA configuration date range.
+
+        Args:
+            products: DataFrame with product identifiers and characteristics.
+            batch_size: Optional number of products per request to the metrics source.
+                        If None, all products are sent in a single request.
+
+        Returns:
+            DataFrame with business metrics for all products.
+        """
         if products is None or len(products) == 0:
             raise ValueError("Products DataFrame cannot be empty")
 
+        if batch_size is not None:
+            batch_size = self._validate_batch_size(batch_size)
+
         # Get date range from DATA configuration
-        start_date = self.data_config["START_DATE"]
-        end_date = self.data_config["END_DATE"]
+        start_date, end_date = self._date_range
+
+        # A single batch needs neither slicing nor concatenation
+        if batch_size is None or batch_size >= len(products):
+            return self.metrics_source.retrieve_business_metrics(
+                products=products, start_date=start_date, end_date=end_date
+            )
+
+        # Collect per-batch results and concatenate once at the end
+        frames = [
+            self.metrics_source.retrieve_business_metrics(
+                products=products.iloc[start : start + batch_size],
+                start_date=start_date,
+                end_date=end_date,
+            )
+            for start in range(0, len(products), batch_size)
+        ]
+
+        combined = pd.concat(frames, ignore_index=True)
+
+        # Batches with different categories, or empty object-typed batches, are concatenated
+        # to object, so restore the dtype of every column that is categorical in any batch
+        categorical_columns = {
+            column
+            for frame in frames
+            for column, dtype in frame.dtypes.items()
+            if isinstance(dtype, pd.CategoricalDtype)
+        }
+        for column in categorical_columns:
+            if not isinstance(combined[column].dtype, pd.CategoricalDtype):
+                combined[column] = combined[column].astype("category")
+
+        return combined
+
+    @staticmethod
+    def _validate_batch_size(batch_size: Any) -> int:
+        """Validate batch_size and return it as a plain int."""
+        # bool is an int subclass, but True/False are not meaningful batch sizes
+        if isinstance(batch_size, bool):
+            raise ValueError("batch_size must be a positive integer")
+
+        # Accept any integral type (e.g. numpy.int64)
+        try:
+            batch_size = operator.index(batch_size)
+        except TypeError:
+            raise ValueError("batch_size must be a positive integer") from None
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        return batch_size
+
+    def close(self) -> None:
+        """Disconnect the metrics source and release its resources."""
+        self.metrics_source.disconnect()
+
+    def __enter__(self) -> "MetricsManager":
+        """Enter the context and return the manager itself."""
+        return self
 
-        return self.metrics_source.retrieve_business_metrics(
-            products=products, start_date=start_date, end_date=end_date
-        )
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit the context and close the manager, even if an exception was raised."""
+        self.close()
 
     def get_current_config(self) -> Optional[Dict[str, Any]]:
-        """Get the currently loaded configuration."""
-        return self.data_config
+        """Get a copy of the currently loaded configuration."""
+        return dict(self.data_config)
@@ -76,16 +76,9 @@ class InterruptedTimeSeriesAdapter(Model):
 
     def validate_connection(self) -> bool:
         """Validate that the model is properly initialized and ready to use."""
-        if not self.is_connected:
-            return False
-
-        try:
-            # Check if statsmodels is available
-            from statsmodels.tsa.statespace.sarimax import SARIMAX  # noqa: F401
-
-            return True
-        except ImportError:
-            return False
+        # statsmodels is imported at module level, so it is available whenever
+        # this adapter is importable; only the connection state needs checking.
+        return self.is_connected
 
     def fit(
         self,
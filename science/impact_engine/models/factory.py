@@ -78,11 +78,12 @@ def get_model_adapter(model_type: str) -> Model:
     Raises:
         ValueError: If the model type is not supported.
     """
-    if model_type not in MODEL_ADAPTERS:
-        available = list(MODEL_ADAPTERS.keys())
+    model_class = MODEL_ADAPTERS.get(model_type)
+    if model_class is None:
+        available = sorted(MODEL_ADAPTERS)
         raise ValueError(f"Unknown model type '{model_type}'. Available types: {available}")
 
-    return MODEL_ADAPTERS[model_type]()
+    return model_class()
 
 
 def register_model_adapter(model_type: str, model_class: type) -> None:
@@ -115,6 +115,17 @@ class TestConfigBridgeToCatalogSimulator:
         assert "visit_to_cart_rate" in params
         assert "cart_to_order_rate" in params
 
+    def test_metrics_params_fresh_per_call(self):
+        """Each call returns an independent, plain-dict METRICS.PARAMS."""
+        ie_config = {"DATA": {"START_DATE": "2024-01-01", "END_DATE": "2024-01-31"}}
+        first = ConfigBridge.to_catalog_simulator(ie_config)["RULE"]["METRICS"]["PARAMS"]
+        first["sale_prob"] = 0.0
+
+        second = ConfigBridge.to_catalog_simulator(ie_config)["RULE"]["METRICS"]["PARAMS"]
+
+        assert type(second) is dict
+        assert second["sale_prob"] == 0.7
+
 
 class TestConfigBridgeFromCatalogSimulator:
     """Tests for ConfigBridge.from_catalog_simulator()."""
@@ -39,6 +39,18 @@ class TestSchema:
         assert "product_id" in result.columns
         assert "external_id" not in result.columns
 
+    def test_from_external_does_not_modify_input(self):
+        """from_external leaves the input DataFrame unchanged."""
+        schema = Schema(
+            required=["product_id"],
+            mappings={"source_a": {"external_id": "product_id"}},
+        )
+        df = pd.DataFrame({"external_id": [1, 2, 3]})
+        result = schema.from_external(df, "source_a")
+        result["product_id"] = 0
+        assert list(df.columns) == ["external_id"]
+        assert df["external_id"].tolist() == [1, 2, 3]
+
     def test_from_external_unknown_source(self):
         """from_external returns copy when source not in mappings."""
         schema = Schema(required=["a"], mappings={"source_a": {"x": "a"}})
@@ -58,6 +70,18 @@ class TestSchema:
         assert "external_id" in result.columns
         assert "product_id" not in result.columns
 
+    def test_to_external_does_not_modify_input(self):
+        """to_external leaves the input DataFrame unchanged."""
+        schema = Schema(
+            required=["product_id"],
+            mappings={"target_a": {"external_id": "product_id"}},
+        )
+        df = pd.DataFrame({"product_id": [1, 2], "external_id": [3, 4]})
+        result = schema.to_external(df, "target_a")
+        assert result["external_id"].tolist() == [1, 2]
+        assert list(df.columns) == ["product_id", "external_id"]
+        assert df["external_id"].tolist() == [3, 4]
+
     def test_to_external_unknown_target(self):
         """to_external returns copy when target not in mappings."""
         schema = Schema(required=["a"], mappings={"target_a": {"x": "a"}})
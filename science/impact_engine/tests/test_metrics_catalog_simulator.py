@@ -4,10 +4,13 @@ from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
+import yaml
 from artifact_store import create_job
 
 from impact_engine.metrics import CatalogSimulatorAdapter
 
+ADAPTER_MODULE = "impact_engine.metrics.adapter_catalog_simulator"
+
 
 class TestCatalogSimulatorAdapter:
     """Tests for CatalogSimulatorAdapter functionality."""
@@ -48,14 +51,23 @@ class TestCatalogSimulatorAdapter:
         assert adapter.config["mode"] == "rule"
         assert adapter.config["seed"] == 42
 
+    def test_disconnect(self):
+        """Test that disconnect resets the connection state."""
+        adapter = CatalogSimulatorAdapter()
+        adapter.connect({"mode": "rule"})
+
+        adapter.disconnect()
+
+        assert adapter.is_connected is False
+        assert adapter.validate_connection() is False
+
     def test_validate_connection_success(self):
         """Test connection validation when connected and simulator available."""
         adapter = CatalogSimulatorAdapter()
         adapter.connect({"mode": "rule"})
 
-        # Mock the core module with RuleBackend
-        mock_core = MagicMock()
-        with patch.dict("sys.modules", {"online_retail_simulator.core": mock_core}):
+        # Mock RuleBackend as resolved at import time
+        with patch(f"{ADAPTER_MODULE}.RuleBackend", MagicMock()):
             assert adapter.validate_connection() is True
 
     def test_validate_connection_not_connected(self):
@@ -69,7 +81,7 @@ class TestCatalogSimulatorAdapter:
         adapter = CatalogSimulatorAdapter()
         adapter.connect({"mode": "rule"})
 
-        with patch("builtins.__import__", side_effect=ImportError):
+        with patch(f"{ADAPTER_MODULE}.RuleBackend", None):
             assert adapter.validate_connection() is False
 
     def test_transform_outbound_success(self):
@@ -119,6 +131,49 @@ class TestCatalogSimulatorAdapter:
         prod_chars = result["product_characteristics"]
         assert "asin" in prod_chars.columns
         assert prod_chars["asin"].iloc[0] == "0"
+        # Input frame is not modified
+        assert "product_id" not in products.columns
+        assert "asin" not in products.columns
+
+    def test_transform_outbound_index_fallback(self):
+        """Test outbound transformation derives string asins from integer and label indexes."""
+        adapter = CatalogSimulatorAdapter()
+        adapter.connect({"mode": "rule"})
+
+        integer_indexed = pd.DataFrame({"name": ["A", "B"]}, index=[10, 20])
+        label_indexed = pd.DataFrame({"name": ["A", "B"]}, index=["x", "y"])
+
+        result = adapter.transform_outbound(integer_indexed, "2024-01-01", "2024-01-31")
+        assert result["product_characteristics"]["asin"].tolist() == ["10", "20"]
+
+        result = adapter.transform_outbound(label_indexed, "2024-01-01", "2024-01-31")
+        assert result["product_characteristics"]["asin"].tolist() == ["x", "y"]
+
+    def test_transform_outbound_uses_first_id_like_column(self):
+        """Test outbound transformation picks the first identifier-like column."""
+        adapter = CatalogSimulatorAdapter()
+        adapter.connect({"mode": "rule"})
+
+        products = pd.DataFrame({"name": ["Product 1"], "SKU": ["sku1"], "item_id": ["id1"]})
+
+        result = adapter.transform_outbound(products, "2024-01-01", "2024-01-31")
+
+        prod_chars = result["product_characteristics"]
+        assert prod_chars["asin"].iloc[0] == "sku1"
+
+    def test_transform_outbound_passes_through_simulator_format(self):
+        """Test outbound transformation keeps products already keyed by asin."""
+        adapter = CatalogSimulatorAdapter()
+        adapter.connect({"mode": "rule"})
+
+        products = pd.DataFrame({"asin": ["B001", "B002"], "sku": ["s1", "s2"]})
+
+        result = adapter.transform_outbound(products, "2024-01-01", "2024-01-31")
+
+        prod_chars = result["product_characteristics"]
+        assert prod_chars["asin"].tolist() == ["B001", "B002"]
+        assert "product_id" not in prod_chars.columns
+        assert result["rule_config"]["CHARACTERISTICS"]["PARAMS"]["num_products"] == 2
 
     def test_transform_outbound_missing_optional_columns(self):
         """Test outbound transformation with missing optional columns."""
@@ -166,6 +221,89 @@ class TestCatalogSimulatorAdapter:
         # Check that ordered_units was mapped to sales_volume
         assert result["sales_volume"].iloc[0] == 5
         assert result["metrics_source"].iloc[0] == "catalog_simulator"
+        assert isinstance(result["metrics_source"].dtype, pd.CategoricalDtype)
+        assert isinstance(result["category"].dtype, pd.CategoricalDtype)
+        assert result["category"].iloc[0] == "Electronics"
+        assert pd.api.types.is_datetime64_any_dtype(result["retrieval_timestamp"])
+
+    def test_transform_inbound_parses_date_strings(self):
+        """Test inbound transformation converts string dates and keeps datetime dates."""
+        adapter = CatalogSimulatorAdapter()
+
+        string_dates = pd.DataFrame(
+            {"asin": ["prod1"], "date": ["2024-01-01"], "ordered_units": [1], "revenue": [1.0]}
+        )
+        datetime_dates = string_dates.assign(date=pd.to_datetime(string_dates["date"]))
+
+        for external_data in (string_dates, datetime_dates):
+            result = adapter.transform_inbound(external_data)
+            assert pd.api.types.is_datetime64_any_dtype(result["date"])
+            assert result["date"].iloc[0] == pd.Timestamp("2024-01-01")
+
+    def test_transform_inbound_coerces_numeric_columns(self):
+        """Test inbound transformation coerces non-numeric metric columns."""
+        adapter = CatalogSimulatorAdapter()
+
+        external_data = pd.DataFrame(
+            {
+                "asin": ["prod1", "prod2"],
+                "date": ["2024-01-01", "2024-01-01"],
+                "price": ["10.5", "bad"],
+                "ordered_units": ["3", None],
+                "revenue": [31.5, 0.0],
+            }
+        )
+
+        result = adapter.transform_inbound(external_data)
+
+        assert result["price"].iloc[0] == 10.5
+        assert pd.isna(result["price"].iloc[1])
+        assert result["sales_volume"].tolist() == [3, 0]
+        assert pd.api.types.is_integer_dtype(result["sales_volume"])
+        assert result["revenue"].tolist() == [31.5, 0.0]
+
+    def test_transform_inbound_column_order(self):
+        """Test inbound transformation orders columns by schema and drops unknown ones."""
+        adapter = CatalogSimulatorAdapter()
+
+        external_data = pd.DataFrame(
+            {
+                "revenue": [500.0],
+                "unknown": ["x"],
+                "ordered_units": [5],
+                "date": ["2024-01-01"],
+                "asin": ["prod1"],
+            }
+        )
+
+        result = adapter.transform_inbound(external_data)
+
+        assert list(result.columns) == [
+            "product_id",
+            "date",
+            "sales_volume",
+            "revenue",
+            "metrics_source",
+            "retrieval_timestamp",
+        ]
+
+    def test_transform_inbound_legacy_quantity_column(self):
+        """Test inbound transformation maps legacy 'quantity' to sales_volume."""
+        adapter = CatalogSimulatorAdapter()
+
+        external_data = pd.DataFrame(
+            {
+                "asin": ["prod1"],
+                "date": ["2024-01-01"],
+                "quantity": [7],
+                "revenue": [700.0],
+            }
+        )
+
+        result = adapter.transform_inbound(external_data)
+
+        assert "quantity" not in result.columns
+        assert result["sales_volume"].iloc[0] == 7
 
     def test_transform_inbound_invalid_input(self):
         """Test inbound transformation with invalid input."""
@@ -199,6 +337,16 @@ class TestCatalogSimulatorAdapter:
         for col in expected_columns:
             assert col in result.columns
 
+    def test_transform_inbound_empty_results_are_independent(self):
+        """Test that modifying one empty result does not affect later ones."""
+        adapter = CatalogSimulatorAdapter()
+
+        first = adapter.transform_inbound(pd.DataFrame())
+        first["extra"] = []
+
+        second = adapter.transform_inbound(pd.DataFrame())
+        assert "extra" not in second.columns
+
     def test_retrieve_business_metrics_success(self, tmp_path):
         """Test successful business metrics retrieval."""
         # Create a parent job for nested job creation
@@ -237,6 +385,54 @@ class TestCatalogSimulatorAdapter:
         assert "product_id" in result.columns
         assert "sales_volume" in result.columns
 
+    def test_retrieve_business_metrics_batch_success(self, tmp_path):
+        """Test retrieving metrics for several date ranges in one call."""
+        parent_job = create_job(str(tmp_path), prefix="test-parent")
+
+        adapter = CatalogSimulatorAdapter()
+        adapter.connect({"mode": "rule", "seed": 42, "parent_job": parent_job})
+
+        products = pd.DataFrame({"product_id": ["prod1"], "name": ["Product 1"]})
+        simulated_ranges = []
+
+        # Mock simulate_metrics to save one sales row at the configured start date
+        def mock_simulate_metrics(job_info, config_path):
+            with open(config_path) as f:
+                params = yaml.safe_load(f)["RULE"]["METRICS"]["PARAMS"]
+            simulated_ranges.append((params["date_start"], params["date_end"]))
+            sales_df = pd.DataFrame(
+                {
+                    "asin": ["prod1"],
+                    "date": [params["date_start"]],
+                    "ordered_units": [5],
+                    "revenue": [500.0],
+                }
+            )
+            job_info.save_df("sales", sales_df)
+            return job_info
+
+        mock_simulate_module = MagicMock()
+        mock_simulate_module.simulate_metrics = mock_simulate_metrics
+
+        date_ranges = [("2024-01-01", "2024-01-31"), ("2024-02-01", "2024-02-29")]
+        with patch.dict("sys.modules", {"online_retail_simulator.simulate": mock_simulate_module}):
+            result = adapter.retrieve_business_metrics_batch(products, date_ranges)
+
+        assert simulated_ranges == date_ranges
+        assert len(result) == 2
+        assert result["date"].tolist() == [pd.Timestamp("2024-01-01"), pd.Timestamp("2024-02-01")]
+        assert result["product_id"].tolist() == ["prod1", "prod1"]
+
+    def test_retrieve_business_metrics_batch_empty_ranges(self):
+        """Test batch retrieval without any date ranges."""
+        adapter = CatalogSimulatorAdapter()
+        adapter.connect({"mode": "rule"})
+
+        products = pd.DataFrame({"product_id": ["prod1"]})
+
+        with pytest.raises(ValueError, match="At least one date range is required"):
+            adapter.retrieve_business_metrics_batch(products, [])
+
     def test_retrieve_business_metrics_not_connected(self):
         """Test retrieving metrics without connection."""
         adapter = CatalogSimulatorAdapter()
@@ -2,9 +2,11 @@
 
 import json
 import tempfile
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -148,6 +150,29 @@ class TestMetricsManagerConfiguration:
         manager = MetricsManager(config, mock_adapter)
         assert manager.get_current_config() == config
 
+    def test_data_config_is_read_only(self):
+        """Test that the stored configuration cannot be mutated after validation."""
+        mock_adapter = MockMetricsAdapter()
+        config = {"START_DATE": "2024-01-01", "END_DATE": "2024-01-31"}
+
+        manager = MetricsManager(config, mock_adapter)
+
+        with pytest.raises(TypeError):
+            manager.data_config["START_DATE"] = "2024-02-01"
+
+        # Mutating the caller's dict does not affect the manager
+        config["START_DATE"] = "2024-02-01"
+        assert manager.data_config["START_DATE"] == "2024-01-01"
+
+    def test_parsed_date_range(self):
+        """Test that the validated date range is exposed as datetimes."""
+        mock_adapter = MockMetricsAdapter()
+        config = {"START_DATE": "2024-01-01", "END_DATE": "2024-01-31"}
+
+        manager = MetricsManager(config, mock_adapter)
+        assert manager.start_date == datetime(2024, 1, 1)
+        assert manager.end_date == datetime(2024, 1, 31)
+
 
 class TestMetricsManagerRetrieveMetrics:
     """Tests for metrics retrieval."""
@@ -184,6 +209,114 @@ class TestMetricsManagerRetrieveMetrics:
             products=products, start_date="2024-01-01", end_date="2024-01-31"
         )
 
+    def test_retrieve_metrics_batched(self):
+        """Test that batch_size splits products into multiple adapter calls."""
+        mock_adapter = Mock(spec=MetricsInterface)
+        mock_adapter.connect.return_value = True
+        mock_adapter.retrieve_business_metrics.side_effect = lambda products, **kwargs: (
+            pd.DataFrame({"product_id": products["product_id"].tolist()})
+        )
+
+        config = {"START_DATE": "2024-01-01", "END_DATE": "2024-01-31"}
+        manager = MetricsManager(config, mock_adapter)
+
+        products = pd.DataFrame({"product_id": ["p1", "p2", "p3", "p4", "p5"]})
+        result = manager.retrieve_metrics(products, batch_size=2)
+
+        assert mock_adapter.retrieve_business_metrics.call_count == 3
+        assert result["product_id"].tolist() == ["p1", "p2", "p3", "p4", "p5"]
+        assert list(result.index) == [0, 1, 2, 3, 4]
+
+    def test_retrieve_metrics_batched_keeps_categorical(self):
+        """Test that categorical columns stay categorical across batches."""
+        mock_adapter = Mock(spec=MetricsInterface)
+        mock_adapter.connect.return_value = True
+        mock_adapter.retrieve_business_metrics.side_effect = lambda products, **kwargs: (
+            pd.DataFrame({"category": pd.Categorical(products["category"])})
+        )
+
+        config = {"START_DATE": "2024-01-01", "END_DATE": "2024-01-31"}
+        manager = MetricsManager(config, mock_adapter)
+
+        products = pd.DataFrame({"category": ["Electronics", "Books", "Toys"]})
+        result = manager.retrieve_metrics(products, batch_size=1)
+
+        assert isinstance(result["category"].dtype, pd.CategoricalDtype)
+        assert result["category"].tolist() == ["Electronics", "Books", "Toys"]
+
+    def test_retrieve_metrics_batched_keeps_categorical_after_empty_batch(self):
+        """Test that an empty first batch does not drop the categorical dtype."""
+        mock_adapter = Mock(spec=MetricsInterface)
+        mock_adapter.connect.return_value = True
+        mock_adapter.retrieve_business_metrics.side_effect = [
+            pd.DataFrame(columns=["category"]),
+            pd.DataFrame({"category": pd.Categorical(["Books"])}),
+        ]
+
+        config = {"START_DATE": "2024-01-01", "END_DATE": "2024-01-31"}
+        manager = MetricsManager(config, mock_adapter)
+
+        products = pd.DataFrame({"category": ["Electronics", "Books"]})
+        result = manager.retrieve_metrics(products, batch_size=1)
+
+        assert isinstance(result["category"].dtype, pd.CategoricalDtype)
+        assert result["category"].tolist() == ["Books"]
+
+    def test_retrieve_metrics_single_batch(self):
+        """Test that a batch_size covering all products issues a single call."""
+        mock_adapter = Mock(spec=MetricsInterface)
+        mock_adapter.connect.return_value = True
+        mock_adapter.retrieve_business_metrics.return_value = pd.DataFrame({"product_id": ["p1"]})
+
+        config = {"START_DATE": "2024-01-01", "END_DATE": "2024-01-31"}
+        manager = MetricsManager(config, mock_adapter)
+
+        products = pd.DataFrame({"product_id": ["p1", "p2"]})
+        manager.retrieve_metrics(products, batch_size=10)
+
+        mock_adapter.retrieve_business_metrics.assert_called_once_with(
+            products=products, start_date="2024-01-01", end_date="2024-01-31"
+        )
+
+    def test_retrieve_metrics_invalid_batch_size(self):
+        """Test retrieving metrics with a non-positive batch size."""
+        mock_adapter = MockMetricsAdapter()
+        config = {"START_DATE": "2024-01-01", "END_DATE": "2024-01-31"}
+
+        manager = MetricsManager(config, mock_adapter)
+        products = pd.DataFrame({"product_id": ["p1"]})
+
+        with pytest.raises(ValueError, match="batch_size must be a positive integer"):
+            manager.retrieve_metrics(products, batch_size=0)
+
+    def test_retrieve_metrics_bool_batch_size(self):
+        """Test that a bool is rejected as batch size."""
+        mock_adapter = MockMetricsAdapter()
+        config = {"START_DATE": "2024-01-01", "END_DATE": "2024-01-31"}
+
+        manager = MetricsManager(config, mock_adapter)
+        products = pd.DataFrame({"product_id": ["p1"]})
+
+        with pytest.raises(ValueError, match="batch_size must be a positive integer"):
+            manager.retrieve_metrics(products, batch_size=True)
+
+    def test_retrieve_metrics_numpy_batch_size(self):
+        """Test that integral NumPy scalars are accepted as batch size."""
+        mock_adapter = Mock(spec=MetricsInterface)
+        mock_adapter.connect.return_value = True
+        mock_adapter.retrieve_business_metrics.side_effect = lambda products, **kwargs: (
+            pd.DataFrame({"product_id": products["product_id"].tolist()})
+        )
+
+        config = {"START_DATE": "2024-01-01", "END_DATE": "2024-01-31"}
+        manager = MetricsManager(config, mock_adapter)
+
+        products = pd.DataFrame({"product_id": ["p1", "p2", "p3"]})
+        result = manager.retrieve_metrics(products, batch_size=np.int64(2))
+
+        assert mock_adapter.retrieve_business_metrics.call_count == 2
+        assert result["product_id"].tolist() == ["p1", "p2", "p3"]
+
     def test_retrieve_metrics_empty_products(self):
         """Test retrieving metrics with empty products."""
         mock_adapter = MockMetricsAdapter()
@@ -205,6 +338,33 @@ class TestMetricsManagerRetrieveMetrics:
             manager.retrieve_metrics(None)
 
 
+class TestMetricsManagerLifecycle:
+    """Tests for releasing the metrics source."""
+
+    def test_close_disconnects_adapter(self):
+        """Test that close() disconnects the injected adapter."""
+        mock_adapter = Mock(spec=MetricsInterface)
+        mock_adapter.connect.return_value = True
+
+        config = {"START_DATE": "2024-01-01", "END_DATE": "2024-01-31"}
+        manager = MetricsManager(config, mock_adapter)
+        manager.close()
+
+        mock_adapter.disconnect.assert_called_once()
+
+    def test_context_manager_disconnects_on_exit(self):
+        """Test that the manager disconnects the adapter when used as a context manager."""
+        mock_adapter = Mock(spec=MetricsInterface)
+        mock_adapter.connect.return_value = True
+
+        config = {"START_DATE": "2024-01-01", "END_DATE": "2024-01-31"}
+        with MetricsManager(config, mock_adapter) as manager:
+            assert manager.metrics_source is mock_adapter
+            mock_adapter.disconnect.assert_not_called()
+
+        mock_adapter.disconnect.assert_called_once()
+
+
 class TestMetricsFactory:
     """Tests for factory functions."""
 
@@ -2,11 +2,13 @@
 
 import tempfile
 
+import numpy as np
 import pandas as pd
 import pytest
 from artifact_store import ArtifactStore
 
 from impact_engine.models import InterruptedTimeSeriesAdapter
+from impact_engine.models.adapter_interrupted_time_series import TransformedInput
 
 
 class TestInterruptedTimeSeriesAdapter:
@@ -119,10 +121,6 @@ class TestInterruptedTimeSeriesAdapter:
 
     def test_format_results_success(self):
         """Test successful result formatting using stateless _format_results."""
-        import numpy as np
-
-        from impact_engine.models.adapter_interrupted_time_series import TransformedInput
-
         model = InterruptedTimeSeriesAdapter()
         model.connect({"dependent_variable": "revenue"})
 
@@ -7,6 +7,7 @@ from unittest.mock import Mock
 
 import pandas as pd
 import pytest
+from artifact_store import ArtifactStore
 
 from impact_engine.models import (
     Model,
@@ -131,8 +132,6 @@ class TestModelsManagerFitModel:
 
     def test_fit_model_success(self):
         """Test successful model fitting."""
-        from artifact_store import ArtifactStore
-
         mock_model = MockModel()
         config = {"PARAMS": {"INTERVENTION_DATE": "2024-01-15"}}
 
@@ -152,8 +151,6 @@ class TestModelsManagerFitModel:
 
     def test_fit_model_uses_config_intervention_date(self):
         """Test that fit_model uses intervention date from config."""
-        from artifact_store import ArtifactStore
-
         mock_model = Mock(spec=Model)
         mock_model.connect.return_value = True
         mock_model.fit.return_value = "/path/to/results.json"
@@ -181,8 +178,6 @@ class TestModelsManagerFitModel:
         data = pd.DataFrame({"date": pd.date_range("2024-01-01", periods=10), "value": range(10)})
 
         with tempfile.TemporaryDirectory() as tmpdir:
-            from artifact_store import ArtifactStore
-
             storage = ArtifactStore(tmpdir)
 
             with pytest.raises(ValueError, match="INTERVENTION_DATE must be specified"):
@@ -202,8 +197,6 @@ class TestModelsManagerFitModel:
 
     def test_fit_model_with_explicit_params(self):
         """Test fit_model with explicitly provided parameters."""
-        from artifact_store import ArtifactStore
-
         mock_model = Mock(spec=Model)
         mock_model.connect.return_value = True
         mock_model.fit.return_value = "/path/to/results.json"